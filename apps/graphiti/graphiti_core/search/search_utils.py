@@ -20,7 +20,6 @@ from time import time
 from typing import Any
 
 import numpy as np
-from numpy._typing import NDArray
 from typing_extensions import LiteralString
 
 from graphiti_core.driver.driver import (
@@ -35,7 +34,6 @@ from graphiti_core.graph_queries import (
 )
 from graphiti_core.helpers import (
     lucene_sanitize,
-    normalize_l2,
     semaphore_gather,
 )
 from graphiti_core.models.edges.edge_db_queries import get_entity_edge_return_query
@@ -1842,38 +1840,31 @@ def maximal_marginal_relevance(
     min_score: float = -2.0,
 ) -> tuple[list[str], list[float]]:
     start = time()
-    query_array = np.array(query_vector)
-    candidate_arrays: dict[str, NDArray] = {}
-    for uuid, embedding in candidates.items():
-        candidate_arrays[uuid] = normalize_l2(embedding)
+    if not candidates:
+        return [], []
 
-    uuids: list[str] = list(candidate_arrays.keys())
+    uuids: list[str] = list(candidates.keys())
 
-    similarity_matrix = np.zeros((len(uuids), len(uuids)))
+    # L2-normalize all candidates at once; zero vectors are left as-is
+    candidate_matrix = np.array(list(candidates.values()), dtype=np.float64)
+    norms = np.linalg.norm(candidate_matrix, axis=1, keepdims=True)
+    candidate_matrix = np.divide(candidate_matrix, norms, out=candidate_matrix, where=norms != 0)
 
-    for i, uuid_1 in enumerate(uuids):
-        for j, uuid_2 in enumerate(uuids[:i]):
-            u = candidate_arrays[uuid_1]
-            v = candidate_arrays[uuid_2]
-            similarity = np.dot(u, v)
+    # Pairwise candidate similarity in a single matrix product
+    similarity_matrix = candidate_matrix @ candidate_matrix.T
+    np.fill_diagonal(similarity_matrix, 0.0)
 
-            similarity_matrix[i, j] = similarity
-            similarity_matrix[j, i] = similarity
+    query_similarity = candidate_matrix @ np.array(query_vector, dtype=np.float64)
+    mmr_scores = mmr_lambda * query_similarity + (mmr_lambda - 1) * similarity_matrix.max(axis=1)
 
-    mmr_scores: dict[str, float] = {}
-    for i, uuid in enumerate(uuids):
-        max_sim = np.max(similarity_matrix[i, :])
-        mmr = mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
-        mmr_scores[uuid] = mmr
-
-    uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
+    # Stable sort keeps input order among equal scores
+    order = np.argsort(-mmr_scores, kind='stable')
+    order = order[mmr_scores[order] >= min_score]
 
     end = time()
     logger.debug(f'Completed MMR reranking in {(end - start) * 1000} ms')
 
-    return [uuid for uuid in uuids if mmr_scores[uuid] >= min_score], [
-        mmr_scores[uuid] for uuid in uuids if mmr_scores[uuid] >= min_score
-    ]
+    return [uuids[i] for i in order], mmr_scores[order].tolist()
 
 
 async def get_embeddings_for_nodes(
@@ -162,12 +162,29 @@ async def add_nodes_and_edges_bulk_tx(
         episode['source'] = str(episode['source'].value)
         episode.pop('labels', None)
 
+    # Embed everything that is still missing in one batch per type instead of
+    # one embedding request per node/edge. Texts are normalized the same way as
+    # in generate_name_embedding/generate_embedding, and empty ones are kept,
+    # so the vectors match the per-item path
+    missing_nodes = [node for node in entity_nodes if node.name_embedding is None]
+    if missing_nodes:
+        name_embeddings = await embedder.create_batch(
+            [node.name.replace('\n', ' ') for node in missing_nodes]
+        )
+        for node, name_embedding in zip(missing_nodes, name_embeddings, strict=True):
+            node.name_embedding = name_embedding
+
+    missing_edges = [edge for edge in entity_edges if edge.fact_embedding is None]
+    if missing_edges:
+        fact_embeddings = await embedder.create_batch(
+            [edge.fact.replace('\n', ' ') for edge in missing_edges]
+        )
+        for edge, fact_embedding in zip(missing_edges, fact_embeddings, strict=True):
+            edge.fact_embedding = fact_embedding
+
     nodes = []
 
     for node in entity_nodes:
-        if node.name_embedding is None:
-            await node.generate_name_embedding(embedder)
-
         entity_data: dict[str, Any] = {
             'uuid': node.uuid,
             'name': node.name,
@@ -188,8 +205,6 @@ async def add_nodes_and_edges_bulk_tx(
 
     edges = []
     for edge in entity_edges:
-        if edge.fact_embedding is None:
-            await edge.generate_embedding(embedder)
         edge_data: dict[str, Any] = {
             'uuid': edge.uuid,
             'source_node_uuid': edge.source_node_uuid,
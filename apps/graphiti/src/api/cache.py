@@ -0,0 +1,186 @@
+"""
+Kanbu Graphiti Search Cache
+Redis-backed result cache for the search endpoints.
+
+FalkorDB speaks the Redis protocol, so cached responses live next to the
+graph and reuse its connection. Entries hold the rendered JSON body, so a
+hit is returned without parsing.
+
+Keys carry the write generation of the group they read from. Writing or
+deleting an episode bumps that generation (INCR) instead of deleting keys,
+so a search that was already running when the write happened stores its
+result under the old generation, where no later search looks. Old entries
+simply expire.
+
+Recent entries and generations are also kept in process for a few seconds,
+so repeated searches skip the Redis round-trip. Other workers only see this
+process's writes once their copy of the generation expires, which is why
+the local TTL stays short.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'search'
+
+# Namespace for searches that are not restricted to a group
+ALL_GROUPS = '_all'
+
+# Write generation counters: search:gen:<group>, plus one bumped by writes
+# whose group is unknown (they affect every namespace)
+GENERATION_PREFIX = f'{KEY_PREFIX}:gen'
+GLOBAL_GENERATION = f'{GENERATION_PREFIX}:*'
+
+DEFAULT_TTL_SECONDS = 300
+
+# In-process layer in front of Redis
+DEFAULT_LOCAL_TTL_SECONDS = 30
+DEFAULT_LOCAL_MAXSIZE = 1024
+
+
+class SearchCache:
+    """
+    Cache search responses in Redis with a TTL.
+
+    Cache errors are logged and treated as misses; they never fail a search.
+    """
+
+    def __init__(
+        self,
+        redis: Any,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        local_ttl: int = DEFAULT_LOCAL_TTL_SECONDS,
+        local_maxsize: int = DEFAULT_LOCAL_MAXSIZE,
+    ):
+        self.redis = redis
+        self.ttl = ttl
+        self.local_ttl = min(local_ttl, ttl)
+        self.local_maxsize = local_maxsize
+        # key -> (monotonic expiry, body), least recently used first
+        self._local: OrderedDict[str, tuple[float, bytes | str]] = OrderedDict()
+        # generation counter key -> (monotonic expiry, value)
+        self._local_generations: dict[str, tuple[float, int]] = {}
+
+    @staticmethod
+    def make_key(endpoint: str, request: BaseModel, generation: int | None = None) -> str:
+        """
+        Build the key for a search request: search:<group>:<endpoint>:<generation>:<blake2b>.
+        Without a generation the key only identifies the request (used for coalescing).
+        """
+        payload = orjson.dumps(request.model_dump(), option=orjson.OPT_SORT_KEYS)
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        group_id = getattr(request, 'group_id', None) or ALL_GROUPS
+        if generation is None:
+            return f'{KEY_PREFIX}:{group_id}:{endpoint}:{digest}'
+        return f'{KEY_PREFIX}:{group_id}:{endpoint}:{generation}:{digest}'
+
+    async def generation(self, group_id: str | None) -> int | None:
+        """
+        Return the current write generation for searches in `group_id`
+        (None for cross-group searches), or None if it cannot be read.
+
+        Counters only grow, so their sum changes on every relevant write.
+        """
+        counters = [f'{GENERATION_PREFIX}:{group_id or ALL_GROUPS}', GLOBAL_GENERATION]
+        values = [self._get_local_generation(counter) for counter in counters]
+        if None not in values:
+            return sum(values)
+
+        try:
+            stored = await self.redis.mget(counters)
+        except Exception as e:
+            logger.warning(f'Search cache generation read failed: {e}')
+            return None
+
+        values = [int(value or 0) for value in stored]
+        for counter, value in zip(counters, values, strict=True):
+            self._set_local_generation(counter, value)
+        return sum(values)
+
+    async def get(self, key: str) -> bytes | str | None:
+        """Return the cached JSON body for `key`, or None on a miss."""
+        body = self._get_local(key)
+        if body is not None:
+            return body
+
+        try:
+            body = await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f'Search cache read failed: {e}')
+            return None
+
+        if body is not None:
+            self._set_local(key, body)
+        return body
+
+    async def set(self, key: str, body: bytes) -> None:
+        """Store a rendered JSON body under `key` for `ttl` seconds."""
+        self._set_local(key, body)
+        try:
+            await self.redis.setex(key, self.ttl, body)
+        except Exception as e:
+            logger.warning(f'Search cache write failed: {e}')
+
+    async def invalidate(self, group_id: str | None = None) -> None:
+        """
+        Retire cached searches that may include data from `group_id` by bumping
+        its generation. Cross-group searches are always retired; without a group
+        id, everything is.
+        """
+        if group_id is None:
+            counters = [GLOBAL_GENERATION]
+        else:
+            counters = [f'{GENERATION_PREFIX}:{group_id}', f'{GENERATION_PREFIX}:{ALL_GROUPS}']
+
+        for counter in counters:
+            # Until the new value is known, this process must not trust its copy
+            self._local_generations.pop(counter, None)
+            try:
+                self._set_local_generation(counter, await self.redis.incr(counter))
+            except Exception as e:
+                logger.warning(f'Search cache invalidation failed: {e}')
+
+    def _get_local(self, key: str) -> bytes | str | None:
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+
+        expires_at, body = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return body
+
+    def _set_local(self, key: str, body: bytes | str) -> None:
+        if self.local_ttl <= 0:
+            return
+
+        self._local[key] = (time.monotonic() + self.local_ttl, body)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_maxsize:
+            self._local.popitem(last=False)
+
+    def _get_local_generation(self, counter: str) -> int | None:
+        entry = self._local_generations.get(counter)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _set_local_generation(self, counter: str, value: int) -> None:
+        if self.local_ttl <= 0:
+            return
+
+        # Counters only grow; a read that raced an INCR must not roll the copy back
+        entry = self._local_generations.get(counter)
+        if entry is not None:
+            value = max(value, entry[1])
+        self._local_generations[counter] = (time.monotonic() + self.local_ttl, value)
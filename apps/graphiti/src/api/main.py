@@ -4,6 +4,7 @@ FastAPI wrapper around graphiti_core for wiki knowledge graph.
 
 Endpoints:
 - POST /episodes - Add episode (wiki page save)
+- POST /episodes/batch - Add multiple episodes (wiki bulk import)
 - GET /episodes - Get episodes for group
 - DELETE /episodes/{uuid} - Delete episode
 - POST /search - Search facts/nodes
@@ -13,6 +14,8 @@ Endpoints:
 - GET /health - Health check
 """
 
+import asyncio
+import copy
 import logging
 import os
 
@@ -24,17 +27,66 @@ import os
 # =============================================================================
 os.environ['GRAPHITI_TELEMETRY_ENABLED'] = 'false'
 
-from contextlib import asynccontextmanager
-from datetime import datetime
-from typing import Any
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from functools import wraps
+from itertools import product
+from operator import attrgetter
+from typing import Annotated, Any
 
+import httpx
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from falkordb.asyncio import FalkorDB
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response, StreamingResponse
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+from redis.asyncio import BlockingConnectionPool
+
+# graphiti_core is imported once here (after telemetry is disabled above)
+# instead of inside the request handlers
+from graphiti_core.cross_encoder.openai_reranker_client import OpenAIRerankerClient
+from graphiti_core.driver.driver import GraphDriver
+from graphiti_core.driver.falkordb_driver import FalkorDriver
+from graphiti_core.embedder.openai import OpenAIEmbedderConfig
+from graphiti_core.graphiti import Graphiti
+from graphiti_core.helpers import validate_group_id
+from graphiti_core.llm_client import LLMConfig, OpenAIClient
+from graphiti_core.nodes import EpisodeType
+from graphiti_core.search.search import search as graphiti_search
+from graphiti_core.search.search_config import (
+    CommunityReranker,
+    CommunitySearchConfig,
+    CommunitySearchMethod,
+    EdgeReranker,
+    EdgeSearchConfig,
+    EdgeSearchMethod,
+    EpisodeReranker,
+    EpisodeSearchConfig,
+    NodeReranker,
+    NodeSearchConfig,
+    NodeSearchMethod,
+    SearchConfig,
+)
+from graphiti_core.search.search_filters import (
+    ComparisonOperator,
+    DateFilter,
+    SearchFilters,
+)
+from graphiti_core.utils.datetime_utils import utc_now
 
+from ..embedder import BatchedOpenAIEmbedder
+from ..entity_types import KANBU_ENTITY_TYPES, KANBU_EXTRACTION_INSTRUCTIONS
+from .cache import SearchCache
+from .responses import OrjsonResponse, RenderedJsonResponse, dumps
 from .schemas import (
     AddEpisodeRequest,
     AddEpisodeResponse,
+    BatchAddEpisodeRequest,
+    BatchAddEpisodeResponse,
+    BatchEpisodeResult,
     EntityTypeInfo,
     EntityTypesResponse,
     EpisodeInfo,
@@ -55,16 +107,152 @@ from .schemas import (
     TemporalQueryRequest,
     TemporalQueryResponse,
 )
+from .settings import Settings
 
 # Load environment variables
 load_dotenv()
 
+# Service settings, read once instead of per request
+settings = Settings.from_env()
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global graphiti instance
-graphiti_client = None
+# The Graphiti client lives on app.state.graphiti (set at startup)
+
+# Guards the one-time creation of the Graphiti client
+_init_lock = asyncio.Lock()
+
+# Background retry of the client creation, started by /health
+_init_task: asyncio.Task | None = None
+
+# Caps concurrent add_episode calls across groups in this worker so bursts of
+# wiki saves queue here instead of fanning out unbounded LLM calls into
+# provider rate limits. Within a group, episodes run one at a time (see
+# _group_episode_lock)
+_episode_semaphore = asyncio.Semaphore(settings.max_concurrent_episodes)
+
+# Per-group Graphiti clients for episode writes, least recently used first
+# (see _group_graphiti)
+_group_clients: OrderedDict[str, Graphiti] = OrderedDict()
+_GROUP_CLIENTS_MAXSIZE = 256
+
+# Per-group episode locks, with the number of episodes holding or waiting for each
+_group_locks: dict[str, tuple[asyncio.Lock, int]] = {}
+
+# Search result cache (shares the FalkorDB connection, created with the client)
+search_cache: SearchCache | None = None
+
+# FalkorDB connection pool; redis-py never closes a pool it was handed, so the
+# lifespan shutdown does
+_connection_pool: BlockingConnectionPool | None = None
+
+# Rendered bodies of searches in progress, by cache key (see _coalesced_search)
+_inflight_searches: dict[str, asyncio.Future[bytes | None]] = {}
+
+# Field getters for graphiti_core EntityEdge results, bound once per module
+# instead of probing every result with hasattr
+_get_edge_fields = attrgetter('uuid', 'name', 'fact')
+_get_edge_detail_fields = attrgetter(
+    'uuid', 'name', 'fact', 'source_node_uuid', 'target_node_uuid', 'valid_at', 'invalid_at'
+)
+
+
+def _edge_to_search_result(edge: Any) -> SearchResult:
+    """Convert an EntityEdge returned by graphiti.search to a SearchResult."""
+    try:
+        uuid, name, fact = _get_edge_fields(edge)
+    except AttributeError:
+        return SearchResult.model_construct(
+            uuid='unknown', name='', content=str(edge), score=1.0, result_type='edge'
+        )
+
+    # graphiti.search returns reranked edges without per-result scores
+    return SearchResult.model_construct(
+        uuid=str(uuid),
+        name=name,
+        content=fact,
+        score=1.0,
+        result_type='edge',
+        metadata={},
+    )
+
+
+# Map episode source string to EpisodeType
+_SOURCE_MAP = {
+    'text': EpisodeType.text,
+    'json': EpisodeType.json,
+    'message': EpisodeType.message,
+}
+
+# Hybrid search lookup tables, built once at import.
+# Method tables are keyed by the request's (use_bm25, use_vector, use_bfs) flags.
+_SEARCH_FLAGS = list(product((False, True), repeat=3))
+
+_EDGE_METHODS = {
+    flags: tuple(
+        method
+        for method, enabled in zip(
+            (EdgeSearchMethod.bm25, EdgeSearchMethod.cosine_similarity, EdgeSearchMethod.bfs),
+            flags,
+            strict=True,
+        )
+        if enabled
+    )
+    for flags in _SEARCH_FLAGS
+}
+_NODE_METHODS = {
+    flags: tuple(
+        method
+        for method, enabled in zip(
+            (NodeSearchMethod.bm25, NodeSearchMethod.cosine_similarity, NodeSearchMethod.bfs),
+            flags,
+            strict=True,
+        )
+        if enabled
+    )
+    for flags in _SEARCH_FLAGS
+}
+# Communities have no BFS search method
+_COMMUNITY_METHODS = {
+    flags: tuple(
+        method
+        for method, enabled in zip(
+            (CommunitySearchMethod.bm25, CommunitySearchMethod.cosine_similarity),
+            flags[:2],
+            strict=True,
+        )
+        if enabled
+    )
+    for flags in _SEARCH_FLAGS
+}
+_SEARCH_METHOD_NAMES = {
+    flags: tuple(
+        name for name, enabled in zip(('bm25', 'vector', 'bfs'), flags, strict=True) if enabled
+    )
+    for flags in _SEARCH_FLAGS
+}
+
+# Map reranker string to enum ('none' falls back to RRF)
+_EDGE_RERANKERS = {
+    'rrf': EdgeReranker.rrf,
+    'mmr': EdgeReranker.mmr,
+    'cross_encoder': EdgeReranker.cross_encoder,
+    'none': EdgeReranker.rrf,
+}
+_NODE_RERANKERS = {
+    'rrf': NodeReranker.rrf,
+    'mmr': NodeReranker.mmr,
+    'cross_encoder': NodeReranker.cross_encoder,
+    'none': NodeReranker.rrf,
+}
+_COMMUNITY_RERANKERS = {
+    'rrf': CommunityReranker.rrf,
+    'mmr': CommunityReranker.mmr,
+    'cross_encoder': CommunityReranker.cross_encoder,
+    'none': CommunityReranker.rrf,
+}
 
 
 # =============================================================================
@@ -72,89 +260,157 @@ graphiti_client = None
 # =============================================================================
 
 
-async def get_graphiti():
+async def get_graphiti() -> Graphiti:
     """Get or create Graphiti client."""
-    global graphiti_client
+    # Fast path: no locking once the client exists
+    if app.state.graphiti is not None:
+        return app.state.graphiti
+
+    # Concurrent first requests wait here so the client and its indices
+    # are built exactly once
+    async with _init_lock:
+        if app.state.graphiti is None:
+            app.state.graphiti = await _create_graphiti()
+
+    return app.state.graphiti
 
-    if graphiti_client is not None:
-        return graphiti_client
 
-    # Import here to avoid circular imports
-    from urllib.parse import urlparse
+async def graphiti_dependency(request: Request) -> Graphiti:
+    """
+    Inject the Graphiti client created at startup.
+    Falls back to lazy creation when startup could not reach FalkorDB.
+    """
+    graphiti = request.app.state.graphiti
+    if graphiti is not None:
+        return graphiti
+
+    try:
+        return await get_graphiti()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-    from graphiti_core.driver.falkordb_driver import FalkorDriver
-    from graphiti_core.embedder import OpenAIEmbedder
-    from graphiti_core.embedder.openai import OpenAIEmbedderConfig
-    from graphiti_core.graphiti import Graphiti
-    from graphiti_core.llm_client import LLMConfig, OpenAIClient
 
-    # Get configuration from environment
-    falkordb_uri = os.getenv('FALKORDB_URI', 'redis://localhost:6379')
-    openai_api_key = os.getenv('OPENAI_API_KEY')
+# Declared async: FastAPI runs plain-def dependencies in its threadpool
+GraphitiDep = Annotated[Graphiti, Depends(graphiti_dependency)]
 
-    # Embedding configuration
-    embedding_model = os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small')
-    embedding_dim = int(os.getenv('EMBEDDING_DIM', '1024'))
 
-    # Parse FalkorDB URI (redis://host:port)
-    parsed = urlparse(falkordb_uri)
-    falkordb_host = parsed.hostname or 'localhost'
-    falkordb_port = parsed.port or 6379
+async def _create_graphiti():
+    """Create and initialize the Graphiti client."""
+    global search_cache, _connection_pool
 
-    if not openai_api_key:
+    if not settings.openai_api_key:
         logger.warning('OPENAI_API_KEY not set, using mock LLM client')
         # For now, we'll create a basic setup
         # In production, you'd want to fail or use Ollama
 
     try:
-        # Create FalkorDB driver
+        # Create FalkorDB driver on a bounded connection pool shared by all
+        # requests, so concurrent queries run on separate connections and
+        # callers wait for a free one instead of failing when it is exhausted
+        connection_pool = BlockingConnectionPool(
+            host=settings.falkordb_host,
+            port=settings.falkordb_port,
+            max_connections=settings.falkordb_max_connections,
+            decode_responses=True,
+        )
+        _connection_pool = connection_pool
         falkor_driver = FalkorDriver(
-            host=falkordb_host,
-            port=falkordb_port,
+            falkor_db=FalkorDB(connection_pool=connection_pool),
             database='kanbu_wiki',
         )
 
+        # Shared OpenAI client for LLM, embedder and reranker: one keep-alive
+        # HTTP/2 connection pool instead of a TCP+TLS handshake per client,
+        # and concurrent embedding chunks are multiplexed over it
+        openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key or 'mock-key',
+            http_client=DefaultAsyncHttpxClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            ),
+        )
+
         # Create LLM client
         llm_config = LLMConfig(
-            api_key=openai_api_key or 'mock-key',
+            api_key=settings.openai_api_key or 'mock-key',
             model='gpt-4o-mini',
         )
-        llm_client = OpenAIClient(llm_config)
+        llm_client = OpenAIClient(llm_config, client=openai_client)
 
         # Create Embedder client (Fase 11)
         # Embeddings are automatically generated for:
         # - Entity nodes (name_embedding)
         # - Entity edges (fact_embedding)
         # - Community nodes (name_embedding)
+        # Texts are sent in batched requests instead of one call per text
         embedder_config = OpenAIEmbedderConfig(
-            api_key=openai_api_key,
-            embedding_model=embedding_model,
-            embedding_dim=embedding_dim,
+            api_key=settings.openai_api_key,
+            embedding_model=settings.embedding_model,
+            embedding_dim=settings.embedding_dim,
+        )
+        embedder = BatchedOpenAIEmbedder(
+            config=embedder_config,
+            client=openai_client,
+            cache_size=settings.embedding_cache_size,
         )
-        embedder = OpenAIEmbedder(config=embedder_config)
 
         logger.info(
-            f'Embedder configured: model={embedding_model}, dim={embedding_dim}'
+            f'Embedder configured: model={settings.embedding_model}, dim={settings.embedding_dim}'
         )
 
         # Create Graphiti instance with FalkorDB driver and embedder
-        graphiti_client = Graphiti(
+        client = Graphiti(
             graph_driver=falkor_driver,
             llm_client=llm_client,
             embedder=embedder,
+            cross_encoder=OpenAIRerankerClient(client=openai_client),
         )
 
         # Initialize the graph database
-        await graphiti_client.build_indices_and_constraints()
+        await client.build_indices_and_constraints()
+        await _warm_connection_pool(falkor_driver.client.connection)
+
+        # FalkorDB is Redis-compatible, so reuse its connection for the search cache
+        if settings.search_cache_ttl > 0:
+            search_cache = SearchCache(
+                falkor_driver.client.connection,
+                ttl=settings.search_cache_ttl,
+                local_ttl=settings.search_cache_local_ttl,
+            )
 
-        logger.info(f'Graphiti client initialized with FalkorDB at {falkordb_host}:{falkordb_port}')
-        return graphiti_client
+        logger.info(
+            'Graphiti client initialized with FalkorDB at '
+            f'{settings.falkordb_host}:{settings.falkordb_port}'
+        )
+        return client
 
     except Exception as e:
         logger.error(f'Failed to initialize Graphiti: {e}')
+        # A retry creates a new pool, so do not leak this attempt's connections
+        if _connection_pool is not None:
+            await _connection_pool.aclose()
+            _connection_pool = None
         raise
 
 
+async def _warm_connection_pool(connection: Any) -> None:
+    """
+    Open FALKORDB_POOL_WARM pool connections up front.
+    Concurrent PINGs each check out their own connection, which stays in the
+    pool afterwards, so a burst of first requests does not pay for the connects.
+    """
+    warm = min(settings.falkordb_pool_warm, settings.falkordb_max_connections)
+    if warm <= 0:
+        return
+
+    try:
+        await asyncio.gather(*[connection.ping() for _ in range(warm)])
+        logger.info(f'Warmed {warm} FalkorDB connections')
+    except Exception as e:
+        # Connections are opened lazily anyway; a failed warm-up is not fatal
+        logger.warning(f'FalkorDB connection warm-up failed: {e}')
+
+
 # =============================================================================
 # Application Lifecycle
 # =============================================================================
@@ -175,10 +431,22 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info('Shutting down Kanbu Graphiti service...')
-    global graphiti_client
-    if graphiti_client:
-        await graphiti_client.close()
-        graphiti_client = None
+    global search_cache, _connection_pool
+    if _init_task is not None:
+        _init_task.cancel()
+    search_cache = None
+    # Per-group clients share the main client's connection, closed below
+    _group_clients.clear()
+    graphiti = app.state.graphiti
+    if graphiti:
+        await graphiti.close()
+        # Closes the HTTP pool shared by the LLM client, embedder and reranker
+        await graphiti.llm_client.client.close()
+        app.state.graphiti = None
+    if _connection_pool is not None:
+        # Includes the connections opened by _warm_connection_pool
+        await _connection_pool.aclose()
+        _connection_pool = None
 
 
 # =============================================================================
@@ -191,62 +459,82 @@ app = FastAPI(
     description='Knowledge graph service for Kanbu Wiki',
     version='1.0.0',
     lifespan=lifespan,
+    # orjson encodes the large search/graph payloads several times faster than json
+    default_response_class=OrjsonResponse,
 )
+app.state.graphiti = None
 
-# CORS middleware
+# CORS middleware: set CORS_ORIGIN in production. Browsers cache the
+# preflight for a day (max_age), so repeat calls skip the OPTIONS round-trip
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=['*'],  # In production, restrict this
+    allow_origins=list(settings.cors_origins),
     allow_credentials=True,
-    allow_methods=['*'],
-    allow_headers=['*'],
+    allow_methods=['GET', 'POST', 'DELETE'],
+    allow_headers=['content-type', 'authorization'],
+    max_age=86400,
 )
 
+# Gzip middleware: search and graph payloads (UUIDs, repeated keys, long facts)
+# compress well; small responses are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # =============================================================================
 # Health & Stats Endpoints
 # =============================================================================
 
 
-@app.get('/health', response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint."""
-    try:
-        graphiti = await get_graphiti()
-        db_connected = graphiti is not None
-    except Exception:
-        db_connected = False
-
-    # Get available entity types
-    from ..entity_types import KANBU_ENTITY_TYPES
-
-    entity_types = list(KANBU_ENTITY_TYPES.keys())
-
-    # Embedding configuration info
-    embedding_model = os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small')
-    embedding_dim = int(os.getenv('EMBEDDING_DIM', '1024'))
-    has_api_key = bool(os.getenv('OPENAI_API_KEY'))
-
-    return HealthResponse(
+def _build_health_response(db_connected: bool) -> HealthResponse:
+    """Describe service health; only database connectivity changes at runtime."""
+    has_api_key = settings.openai_api_key is not None
+    return HealthResponse.model_construct(
         status='healthy' if db_connected else 'unhealthy',
         database_connected=db_connected,
         llm_configured=has_api_key,
         embedder_configured=has_api_key,
         version='1.0.0',
-        entity_types_available=entity_types,
-        embedding_model=embedding_model if has_api_key else None,
-        embedding_dim=embedding_dim if has_api_key else None,
+        entity_types_available=list(KANBU_ENTITY_TYPES.keys()),
+        embedding_model=settings.embedding_model if has_api_key else None,
+        embedding_dim=settings.embedding_dim if has_api_key else None,
     )
 
 
-@app.get('/entity-types', response_model=EntityTypesResponse)
-async def get_entity_types():
+# Both possible bodies, rendered once and keyed by database connectivity
+_HEALTH_BODIES = {
+    connected: dumps(_build_health_response(connected)) for connected in (False, True)
+}
+
+
+def _start_background_init() -> None:
+    """Retry creating the Graphiti client without blocking the caller."""
+    global _init_task
+    if _init_task is None or _init_task.done():
+        _init_task = asyncio.create_task(_background_init())
+
+
+async def _background_init() -> None:
+    # Failures are logged by _create_graphiti; the next probe retries
+    with suppress(Exception):
+        await get_graphiti()
+
+
+@app.get('/health', response_model=HealthResponse)
+async def health_check():
     """
-    List available entity types for extraction.
-    Shows Kanbu-specific entity types and their fields.
+    Health check endpoint.
+    Answers from memory so frequent probes never wait on FalkorDB. While the
+    client is missing (startup could not connect), each probe makes sure a
+    background retry is running.
     """
-    from ..entity_types import KANBU_ENTITY_TYPES, KANBU_EXTRACTION_INSTRUCTIONS
+    db_connected = app.state.graphiti is not None
+    if not db_connected:
+        _start_background_init()
+    return RenderedJsonResponse(_HEALTH_BODIES[db_connected])
+
 
+def _build_entity_types_response() -> EntityTypesResponse:
+    """Describe the Kanbu entity types; they are static, so this runs once at import."""
     entity_types = []
     for type_name, type_model in KANBU_ENTITY_TYPES.items():
         # Get docstring as description
@@ -271,20 +559,33 @@ async def get_entity_types():
     )
 
 
+# Rendered once; every request returns the same bytes
+_ENTITY_TYPES_BODY = dumps(_build_entity_types_response())
+
+
+@app.get('/entity-types', response_model=EntityTypesResponse)
+async def get_entity_types():
+    """
+    List available entity types for extraction.
+    Shows Kanbu-specific entity types and their fields.
+    """
+    return RenderedJsonResponse(_ENTITY_TYPES_BODY)
+
+
 @app.get('/stats', response_model=StatsResponse)
-async def get_stats(group_id: str | None = None):
+async def get_stats(graphiti: GraphitiDep, group_id: str | None = None):
     """Get graph statistics."""
     try:
-        graphiti = await get_graphiti()
-
         # Query stats from graph
         # This is a placeholder - actual implementation depends on graphiti_core
-        return StatsResponse(
-            total_nodes=0,
-            total_edges=0,
-            total_episodes=0,
-            nodes_by_type={},
-            edges_by_type={},
+        return OrjsonResponse(
+            StatsResponse.model_construct(
+                total_nodes=0,
+                total_edges=0,
+                total_episodes=0,
+                nodes_by_type={},
+                edges_by_type={},
+            )
         )
     except Exception as e:
         logger.error(f'Failed to get stats: {e}')
@@ -296,125 +597,205 @@ async def get_stats(group_id: str | None = None):
 # =============================================================================
 
 
-@app.post('/episodes', response_model=AddEpisodeResponse)
-async def add_episode(request: AddEpisodeRequest):
+def _group_graphiti(graphiti: Graphiti, group_id: str) -> Graphiti:
     """
-    Add an episode (wiki page save).
-    This is the main entry point for syncing wiki content to the knowledge graph.
+    Return a Graphiti client bound to the group's FalkorDB graph.
 
-    Features:
-    - LLM-based entity extraction (Fase 10)
-    - Custom Kanbu entity types: WikiPage, Task, User, Project, Concept
-    - Custom extraction instructions for domain-specific context
+    graphiti.add_episode switches the client's driver to the episode's group and
+    keeps using it across awaits, so concurrent episodes of different groups on
+    one client would write into each other's graphs. Each group gets its own
+    client instead, sharing the LLM client, embedder and reranker.
     """
-    try:
-        graphiti = await get_graphiti()
-
-        # Import EpisodeType
-        from graphiti_core.graphiti_types import EpisodeType
-
-        # Map source to EpisodeType
-        source_map = {
-            'text': EpisodeType.text,
-            'json': EpisodeType.json,
-            'message': EpisodeType.message,
-        }
-
-        # Prepare entity types and extraction instructions
-        entity_types = None
-        extraction_instructions = request.custom_instructions or ''
-
-        if request.use_kanbu_entities:
-            from ..entity_types import KANBU_ENTITY_TYPES, KANBU_EXTRACTION_INSTRUCTIONS
+    client = _group_clients.get(group_id)
+    if client is None:
+        validate_group_id(group_id)
+        client = Graphiti(
+            # Cloning schedules the group graph's index build, needed before writes
+            graph_driver=graphiti.driver.clone(database=group_id),
+            llm_client=graphiti.llm_client,
+            embedder=graphiti.embedder,
+            cross_encoder=graphiti.cross_encoder,
+            max_coroutines=graphiti.max_coroutines,
+        )
+        _group_clients[group_id] = client
+        # Evicted clients are only dropped; an episode still running keeps its own
+        while len(_group_clients) > _GROUP_CLIENTS_MAXSIZE:
+            _group_clients.popitem(last=False)
+    _group_clients.move_to_end(group_id)
+    return client
 
-            entity_types = KANBU_ENTITY_TYPES
-            # Combine custom instructions with Kanbu defaults
-            if extraction_instructions:
-                extraction_instructions = f'{KANBU_EXTRACTION_INSTRUCTIONS}\n\n{extraction_instructions}'
-            else:
-                extraction_instructions = KANBU_EXTRACTION_INSTRUCTIONS
 
-        logger.info(
-            f'Adding episode "{request.name}" to group {request.group_id} '
-            f'with entity_types={list(entity_types.keys()) if entity_types else "default"}'
-        )
+@asynccontextmanager
+async def _group_episode_lock(group_id: str) -> AsyncIterator[None]:
+    """
+    Hold the group's episode lock.
+    graphiti requires each episode of a group to be added and awaited before
+    the next one, or dedupe and edge invalidation miss the concurrent episodes.
+    """
+    lock, users = _group_locks.get(group_id, (None, 0))
+    if lock is None:
+        lock = asyncio.Lock()
+    _group_locks[group_id] = (lock, users + 1)
+    try:
+        async with lock:
+            yield
+    finally:
+        lock, users = _group_locks[group_id]
+        if users == 1:
+            del _group_locks[group_id]
+        else:
+            _group_locks[group_id] = (lock, users - 1)
+
+
+async def _process_episode(graphiti: Graphiti, request: AddEpisodeRequest) -> AddEpisodeResponse:
+    """Run one episode through graphiti and build its response."""
+    # Prepare entity types and extraction instructions
+    entity_types = None
+    extraction_instructions = request.custom_instructions or ''
+
+    if request.use_kanbu_entities:
+        entity_types = KANBU_ENTITY_TYPES
+        # Combine custom instructions with Kanbu defaults
+        if extraction_instructions:
+            extraction_instructions = f'{KANBU_EXTRACTION_INSTRUCTIONS}\n\n{extraction_instructions}'
+        else:
+            extraction_instructions = KANBU_EXTRACTION_INSTRUCTIONS
+
+    logger.info(
+        f'Adding episode "{request.name}" to group {request.group_id} '
+        f'with entity_types={list(entity_types.keys()) if entity_types else "default"}'
+    )
 
-        # Add episode to graphiti with custom entity types
-        result = await graphiti.add_episode(
+    # Add episode to graphiti with custom entity types; the group lock is taken
+    # first so episodes queued behind their group do not hold semaphore slots
+    async with _group_episode_lock(request.group_id), _episode_semaphore:
+        result = await _group_graphiti(graphiti, request.group_id).add_episode(
             name=request.name,
             episode_body=request.episode_body,
-            source=source_map.get(request.source, EpisodeType.text),
+            source=_SOURCE_MAP.get(request.source, EpisodeType.text),
             source_description=request.source_description,
             group_id=request.group_id,
-            reference_time=request.reference_time or datetime.now(),
+            # graphiti reads naive datetimes as UTC, so local time would be shifted
+            reference_time=request.reference_time or utc_now(),
             entity_types=entity_types,
-            custom_extraction_instructions=extraction_instructions if extraction_instructions else None,
+            custom_extraction_instructions=extraction_instructions
+            if extraction_instructions
+            else None,
         )
 
-        # Extract result information
-        episode_uuid = str(result.uuid) if hasattr(result, 'uuid') else 'unknown'
-        extracted_entities = result.extracted_entities if hasattr(result, 'extracted_entities') else []
-        created_edges = result.created_edges if hasattr(result, 'created_edges') else []
-
-        # Build entity details
-        entity_details = []
-        for entity in extracted_entities:
-            entity_type = 'Entity'  # Default
-            if hasattr(entity, 'labels') and entity.labels:
-                entity_type = entity.labels[0]
-            elif hasattr(entity, '__class__'):
-                entity_type = entity.__class__.__name__
-
-            entity_details.append(
-                ExtractedEntityInfo(
-                    entity_name=getattr(entity, 'name', str(entity)),
-                    entity_type=entity_type,
-                    is_new=True,  # Will need to track this properly
-                )
-            )
-
-        logger.info(
-            f'Episode "{request.name}" processed: '
-            f'{len(extracted_entities)} entities, {len(created_edges)} relations'
+    # Extract result information (AddEpisodeResults)
+    episode_uuid = str(result.episode.uuid)
+    extracted_entities = result.nodes
+    created_edges = result.edges
+
+    # Build entity details
+    entity_details = [
+        ExtractedEntityInfo.model_construct(
+            entity_name=entity.name,
+            # graphiti builds labels from a set, so 'Entity' is not reliably last
+            entity_type=next((label for label in entity.labels if label != 'Entity'), 'Entity'),
+            is_new=True,  # Will need to track this properly
         )
+        for entity in extracted_entities
+    ]
 
-        return AddEpisodeResponse(
-            episode_uuid=episode_uuid,
-            entities_extracted=len(extracted_entities),
-            relations_created=len(created_edges),
-            entity_details=entity_details,
-        )
+    logger.info(
+        f'Episode "{request.name}" processed: '
+        f'{len(extracted_entities)} entities, {len(created_edges)} relations'
+    )
+
+    if search_cache is not None:
+        await search_cache.invalidate(request.group_id)
+
+    return AddEpisodeResponse.model_construct(
+        episode_uuid=episode_uuid,
+        entities_extracted=len(extracted_entities),
+        relations_created=len(created_edges),
+        entity_details=entity_details,
+    )
+
+
+@app.post('/episodes', response_model=AddEpisodeResponse)
+async def add_episode(request: AddEpisodeRequest, graphiti: GraphitiDep):
+    """
+    Add an episode (wiki page save).
+    This is the main entry point for syncing wiki content to the knowledge graph.
+
+    Features:
+    - LLM-based entity extraction (Fase 10)
+    - Custom Kanbu entity types: WikiPage, Task, User, Project, Concept
+    - Custom extraction instructions for domain-specific context
+    """
+    try:
+        return OrjsonResponse(await _process_episode(graphiti, request))
 
     except Exception as e:
         logger.error(f'Failed to add episode: {e}')
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post('/episodes/batch', response_model=BatchAddEpisodeResponse)
+async def add_episodes_batch(request: BatchAddEpisodeRequest, graphiti: GraphitiDep):
+    """
+    Add multiple episodes in one call (wiki bulk import).
+
+    Episodes are processed one at a time, in request order. graphiti requires
+    each episode of a group to be added and awaited before the next one: entity
+    and edge dedupe, edge invalidation and previous-episode context only see
+    episodes that are already saved. A batch therefore takes about as long as
+    adding its episodes one by one; it saves the per-request overhead, not LLM time.
+    A failing episode does not abort the batch; its error is reported in the results.
+    """
+    results: list[BatchEpisodeResult] = []
+    for index, item in enumerate(request.items):
+        try:
+            result = await _process_episode(graphiti, item)
+            results.append(
+                BatchEpisodeResult.model_construct(index=index, success=True, result=result)
+            )
+        except Exception as e:
+            logger.error(f'Failed to add episode "{item.name}" in batch: {e}')
+            results.append(
+                BatchEpisodeResult.model_construct(index=index, success=False, error=str(e))
+            )
+
+    succeeded = sum(1 for r in results if r.success)
+    logger.info(f'Episode batch processed: {succeeded}/{len(results)} succeeded')
+
+    return OrjsonResponse(
+        BatchAddEpisodeResponse.model_construct(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+        )
+    )
+
+
 @app.post('/episodes/list', response_model=GetEpisodesResponse)
-async def get_episodes(request: GetEpisodesRequest):
+async def get_episodes(request: GetEpisodesRequest, graphiti: GraphitiDep):
     """Get episodes for a group."""
     try:
-        graphiti = await get_graphiti()
-
         # Get episodes from graphiti
         episodes = await graphiti.get_episodes(
             group_id=request.group_id,
             limit=request.limit,
         )
 
-        return GetEpisodesResponse(
-            episodes=[
-                EpisodeInfo(
-                    uuid=str(ep.uuid),
-                    name=ep.name,
-                    content=ep.content,
-                    source=ep.source,
-                    source_description=ep.source_description,
-                    created_at=ep.created_at,
-                    valid_at=ep.valid_at,
-                )
-                for ep in episodes
-            ]
+        return OrjsonResponse(
+            GetEpisodesResponse.model_construct(
+                episodes=[
+                    EpisodeInfo.model_construct(
+                        uuid=str(ep.uuid),
+                        name=ep.name,
+                        content=ep.content,
+                        source=ep.source.value,
+                        source_description=ep.source_description,
+                        created_at=ep.created_at,
+                        valid_at=ep.valid_at,
+                    )
+                    for ep in episodes
+                ]
+            )
         )
 
     except Exception as e:
@@ -423,11 +804,15 @@ async def get_episodes(request: GetEpisodesRequest):
 
 
 @app.delete('/episodes/{episode_uuid}')
-async def delete_episode(episode_uuid: str):
+async def delete_episode(episode_uuid: str, graphiti: GraphitiDep):
     """Delete an episode."""
     try:
-        graphiti = await get_graphiti()
         await graphiti.delete_episode(episode_uuid)
+
+        # The episode's group is unknown here, so drop every cached search
+        if search_cache is not None:
+            await search_cache.invalidate()
+
         return {'success': True, 'uuid': episode_uuid}
     except Exception as e:
         logger.error(f'Failed to delete episode: {e}')
@@ -439,33 +824,82 @@ async def delete_episode(episode_uuid: str):
 # =============================================================================
 
 
+SearchHandler = Callable[..., Awaitable[Response]]
+
+
+def _coalesced_search(endpoint: str) -> Callable[[SearchHandler], SearchHandler]:
+    """
+    Serve a search endpoint from the search cache, and collapse identical
+    concurrent searches into one.
+
+    A request that matches a search already in progress (typeahead bursts,
+    dashboard refreshes) awaits that search's rendered body instead of
+    repeating the query embedding and graph queries. If the leading search
+    fails, waiting requests run their own search, so each reports its own error.
+    """
+
+    def decorator(handler: SearchHandler) -> SearchHandler:
+        @wraps(handler)
+        async def wrapper(**kwargs: Any) -> Response:
+            request = kwargs['request']
+            # The key carries the group's write generation read up front, so a
+            # search overlapping a write never stores into the post-write key
+            generation = None
+            if search_cache is not None:
+                generation = await search_cache.generation(request.group_id)
+            key = SearchCache.make_key(endpoint, request, generation)
+            if generation is not None:
+                cached = await search_cache.get(key)
+                if cached is not None:
+                    return RenderedJsonResponse(cached)
+
+            leader = _inflight_searches.get(key)
+            if leader is not None:
+                # shield: a waiter going away must not cancel the shared result
+                body = await asyncio.shield(leader)
+                if body is not None:
+                    return RenderedJsonResponse(body)
+
+            future: asyncio.Future[bytes | None] = asyncio.get_running_loop().create_future()
+            _inflight_searches[key] = future
+            body = None
+            try:
+                response = await handler(**kwargs)
+                body = response.body
+            finally:
+                future.set_result(body)
+                if _inflight_searches.get(key) is future:
+                    del _inflight_searches[key]
+
+            if generation is not None:
+                await search_cache.set(key, body)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
 @app.post('/search', response_model=SearchResponse)
-async def search(request: SearchRequest):
+@_coalesced_search('search')
+async def search(request: SearchRequest, graphiti: GraphitiDep):
     """Search the knowledge graph."""
     try:
-        graphiti = await get_graphiti()
-
         # Perform search
         results = await graphiti.search(
             query=request.query,
             group_ids=[request.group_id] if request.group_id else None,
             num_results=request.limit,
+            # Each group lives in its own FalkorDB graph
+            driver=_group_driver(graphiti, request.group_id) if request.group_id else None,
         )
 
-        return SearchResponse(
-            results=[
-                SearchResult(
-                    uuid=str(r.uuid) if hasattr(r, 'uuid') else 'unknown',
-                    name=r.name if hasattr(r, 'name') else '',
-                    content=r.fact if hasattr(r, 'fact') else str(r),
-                    score=r.score if hasattr(r, 'score') else 1.0,
-                    result_type='edge',
-                    metadata={},
-                )
-                for r in results
-            ],
-            total=len(results),
-            query=request.query,
+        return OrjsonResponse(
+            SearchResponse.model_construct(
+                results=[_edge_to_search_result(r) for r in results],
+                total=len(results),
+                query=request.query,
+            )
         )
 
     except Exception as e:
@@ -474,20 +908,12 @@ async def search(request: SearchRequest):
 
 
 @app.post('/search/temporal', response_model=TemporalQueryResponse)
-async def temporal_search(request: TemporalQueryRequest):
+@_coalesced_search('temporal')
+async def temporal_search(request: TemporalQueryRequest, graphiti: GraphitiDep):
     """
     Temporal search - "What did we know at time X?"
     """
     try:
-        graphiti = await get_graphiti()
-
-        # Import search filters
-        from graphiti_core.search.search_filters import (
-            ComparisonOperator,
-            DateFilter,
-            SearchFilters,
-        )
-
         # Create temporal filters
         filters = SearchFilters(
             valid_at=[
@@ -515,21 +941,14 @@ async def temporal_search(request: TemporalQueryRequest):
             group_ids=[request.group_id],
             num_results=request.limit,
             filters=filters,
+            driver=_group_driver(graphiti, request.group_id),
         )
 
-        return TemporalQueryResponse(
-            results=[
-                SearchResult(
-                    uuid=str(r.uuid) if hasattr(r, 'uuid') else 'unknown',
-                    name=r.name if hasattr(r, 'name') else '',
-                    content=r.fact if hasattr(r, 'fact') else str(r),
-                    score=r.score if hasattr(r, 'score') else 1.0,
-                    result_type='edge',
-                    metadata={},
-                )
-                for r in results
-            ],
-            as_of=request.as_of,
+        return OrjsonResponse(
+            TemporalQueryResponse.model_construct(
+                results=[_edge_to_search_result(r) for r in results],
+                as_of=request.as_of,
+            )
         )
 
     except Exception as e:
@@ -538,7 +957,8 @@ async def temporal_search(request: TemporalQueryRequest):
 
 
 @app.post('/search/hybrid', response_model=HybridSearchResponse)
-async def hybrid_search(request: HybridSearchRequest):
+@_coalesced_search('hybrid')
+async def hybrid_search(request: HybridSearchRequest, graphiti: GraphitiDep):
     """
     Advanced hybrid search (Fase 11).
 
@@ -553,53 +973,10 @@ async def hybrid_search(request: HybridSearchRequest):
     - Cross-encoder - neural reranking
     """
     try:
-        graphiti = await get_graphiti()
-
-        # Import search configuration
-        from graphiti_core.search.search import search as graphiti_search
-        from graphiti_core.search.search_config import (
-            CommunityReranker,
-            CommunitySearchConfig,
-            CommunitySearchMethod,
-            EdgeReranker,
-            EdgeSearchConfig,
-            EdgeSearchMethod,
-            EpisodeReranker,
-            EpisodeSearchConfig,
-            NodeReranker,
-            NodeSearchConfig,
-            NodeSearchMethod,
-            SearchConfig,
-        )
-        from graphiti_core.search.search_filters import SearchFilters
-
-        # Build search methods based on request
-        edge_methods = []
-        node_methods = []
-
-        if request.use_bm25:
-            edge_methods.append(EdgeSearchMethod.bm25)
-            node_methods.append(NodeSearchMethod.bm25)
-        if request.use_vector:
-            edge_methods.append(EdgeSearchMethod.cosine_similarity)
-            node_methods.append(NodeSearchMethod.cosine_similarity)
-        if request.use_bfs:
-            edge_methods.append(EdgeSearchMethod.bfs)
-            node_methods.append(NodeSearchMethod.bfs)
-
-        # Map reranker string to enum
-        edge_reranker_map = {
-            'rrf': EdgeReranker.rrf,
-            'mmr': EdgeReranker.mmr,
-            'cross_encoder': EdgeReranker.cross_encoder,
-            'none': EdgeReranker.rrf,  # Default to RRF
-        }
-        node_reranker_map = {
-            'rrf': NodeReranker.rrf,
-            'mmr': NodeReranker.mmr,
-            'cross_encoder': NodeReranker.cross_encoder,
-            'none': NodeReranker.rrf,
-        }
+        # Look up search methods for the requested flags
+        flags = (request.use_bm25, request.use_vector, request.use_bfs)
+        edge_methods = _EDGE_METHODS[flags]
+        node_methods = _NODE_METHODS[flags]
 
         # Build search config
         edge_config = None
@@ -610,14 +987,14 @@ async def hybrid_search(request: HybridSearchRequest):
         if request.search_edges and edge_methods:
             edge_config = EdgeSearchConfig(
                 search_methods=edge_methods,
-                reranker=edge_reranker_map.get(request.reranker, EdgeReranker.rrf),
+                reranker=_EDGE_RERANKERS.get(request.reranker, EdgeReranker.rrf),
                 mmr_lambda=request.mmr_lambda,
             )
 
         if request.search_nodes and node_methods:
             node_config = NodeSearchConfig(
                 search_methods=node_methods,
-                reranker=node_reranker_map.get(request.reranker, NodeReranker.rrf),
+                reranker=_NODE_RERANKERS.get(request.reranker, NodeReranker.rrf),
                 mmr_lambda=request.mmr_lambda,
             )
 
@@ -627,22 +1004,11 @@ async def hybrid_search(request: HybridSearchRequest):
             )
 
         if request.search_communities:
-            community_reranker_map = {
-                'rrf': CommunityReranker.rrf,
-                'mmr': CommunityReranker.mmr,
-                'cross_encoder': CommunityReranker.cross_encoder,
-                'none': CommunityReranker.rrf,
-            }
             community_config = CommunitySearchConfig(
-                search_methods=[
-                    CommunitySearchMethod.bm25 if request.use_bm25 else None,
-                    CommunitySearchMethod.cosine_similarity if request.use_vector else None,
-                ],
-                reranker=community_reranker_map.get(request.reranker, CommunityReranker.rrf),
+                search_methods=_COMMUNITY_METHODS[flags],
+                reranker=_COMMUNITY_RERANKERS.get(request.reranker, CommunityReranker.rrf),
                 mmr_lambda=request.mmr_lambda,
             )
-            # Filter out None values
-            community_config.search_methods = [m for m in community_config.search_methods if m]
 
         search_config = SearchConfig(
             edge_config=edge_config,
@@ -660,33 +1026,31 @@ async def hybrid_search(request: HybridSearchRequest):
             group_ids=group_ids,
             config=search_config,
             search_filter=SearchFilters(),
+            driver=_group_driver(graphiti, request.group_id) if request.group_id else None,
         )
 
         # Build response
-        search_methods_used = []
-        if request.use_bm25:
-            search_methods_used.append('bm25')
-        if request.use_vector:
-            search_methods_used.append('vector')
-        if request.use_bfs:
-            search_methods_used.append('bfs')
+        search_methods_used = _SEARCH_METHOD_NAMES[flags]
 
         # Convert edges to SearchResult
         edge_results = []
         for i, edge in enumerate(results.edges):
             score = results.edge_reranker_scores[i] if i < len(results.edge_reranker_scores) else 1.0
+            uuid, name, fact, source_node, target_node, valid_at, invalid_at = (
+                _get_edge_detail_fields(edge)
+            )
             edge_results.append(
-                SearchResult(
-                    uuid=str(edge.uuid),
-                    name=edge.name if hasattr(edge, 'name') else '',
-                    content=edge.fact,
+                SearchResult.model_construct(
+                    uuid=str(uuid),
+                    name=name,
+                    content=fact,
                     score=score,
                     result_type='edge',
                     metadata={
-                        'source_node': edge.source_node_uuid,
-                        'target_node': edge.target_node_uuid,
-                        'valid_at': edge.valid_at.isoformat() if edge.valid_at else None,
-                        'invalid_at': edge.invalid_at.isoformat() if edge.invalid_at else None,
+                        'source_node': source_node,
+                        'target_node': target_node,
+                        'valid_at': valid_at.isoformat() if valid_at else None,
+                        'invalid_at': invalid_at.isoformat() if invalid_at else None,
                     },
                 )
             )
@@ -696,7 +1060,7 @@ async def hybrid_search(request: HybridSearchRequest):
         for i, node in enumerate(results.nodes):
             score = results.node_reranker_scores[i] if i < len(results.node_reranker_scores) else 1.0
             node_results.append(
-                SearchResult(
+                SearchResult.model_construct(
                     uuid=str(node.uuid),
                     name=node.name,
                     content=node.summary or node.name,
@@ -713,7 +1077,7 @@ async def hybrid_search(request: HybridSearchRequest):
         for i, ep in enumerate(results.episodes):
             score = results.episode_reranker_scores[i] if i < len(results.episode_reranker_scores) else 1.0
             episode_results.append(
-                SearchResult(
+                SearchResult.model_construct(
                     uuid=str(ep.uuid),
                     name=ep.name,
                     content=ep.content[:500] if ep.content else '',
@@ -735,7 +1099,7 @@ async def hybrid_search(request: HybridSearchRequest):
                 else 1.0
             )
             community_results.append(
-                SearchResult(
+                SearchResult.model_construct(
                     uuid=str(comm.uuid),
                     name=comm.name,
                     content=comm.summary or comm.name,
@@ -755,15 +1119,17 @@ async def hybrid_search(request: HybridSearchRequest):
             f'episodes={len(episode_results)}, communities={len(community_results)})'
         )
 
-        return HybridSearchResponse(
-            edges=edge_results,
-            nodes=node_results,
-            episodes=episode_results,
-            communities=community_results,
-            query=request.query,
-            search_methods_used=search_methods_used,
-            reranker_used=request.reranker,
-            total_results=total,
+        return OrjsonResponse(
+            HybridSearchResponse.model_construct(
+                edges=edge_results,
+                nodes=node_results,
+                episodes=episode_results,
+                communities=community_results,
+                query=request.query,
+                search_methods_used=search_methods_used,
+                reranker_used=request.reranker,
+                total_results=total,
+            )
         )
 
     except Exception as e:
@@ -776,36 +1142,102 @@ async def hybrid_search(request: HybridSearchRequest):
 # =============================================================================
 
 
-@app.post('/graph', response_model=GetGraphResponse)
-async def get_graph(request: GetGraphRequest):
-    """Get graph data for visualization."""
-    try:
-        graphiti = await get_graphiti()
+# One round-trip per request: every node of the group together with its outgoing
+# edges. group_id is a bind parameter, so the query text is identical for every
+# group and FalkorDB reuses the cached execution plan.
+GRAPH_QUERY = """
+    MATCH (n {group_id: $group_id})
+    RETURN n.uuid AS uuid, n.name AS name, labels(n) AS labels,
+           n.summary AS summary, n.created_at AS created_at,
+           [(n)-[r]->(m {group_id: $group_id}) | {
+               target: m.uuid, edge_type: type(r), fact: r.fact,
+               valid_at: r.valid_at, invalid_at: r.invalid_at
+           }] AS edges
+"""
 
-        # Get all nodes and edges for the group
-        # This is a custom query for visualization purposes
-        nodes = []
-        edges = []
 
-        # Query nodes
-        node_query = f"""
-            MATCH (n)
-            WHERE n.group_id = '{request.group_id}'
-            RETURN n, labels(n) as labels
-        """
+def _group_driver(graphiti: Graphiti, group_id: str) -> GraphDriver:
+    """
+    Return a driver bound to the group's FalkorDB graph, for read queries.
+
+    Constructing (or clone()-ing) a FalkorDriver schedules a full index build,
+    which a read with an arbitrary group id must not trigger. Reads reuse the
+    group's write client driver when there is one, and otherwise a shallow copy
+    of the main driver pointed at the group's graph (same connection, nothing
+    kept per group).
+    """
+    validate_group_id(group_id)
+    driver = graphiti.driver
+    if group_id == driver._database:
+        return driver
+
+    client = _group_clients.get(group_id)
+    if client is not None:
+        return client.driver
+
+    driver = copy.copy(driver)
+    driver._database = group_id
+    return driver
+
+
+# Records serialized per chunk of the streamed /graph body
+_GRAPH_CHUNK_RECORDS = 256
+
+
+def _graph_node(record: dict[str, Any]) -> GraphNode:
+    labels = record['labels'] or []
+    # Prefer the specific entity type (e.g. WikiPage) over the generic label
+    node_type = next((label for label in labels if label != 'Entity'), 'Entity')
+    return GraphNode.model_construct(
+        id=record['uuid'],
+        label=record['name'] or record['uuid'],
+        node_type=node_type,
+        properties={
+            'summary': record['summary'],
+            'created_at': record['created_at'],
+        },
+    )
 
-        # Query edges
-        edge_query = f"""
-            MATCH (s)-[r]->(t)
-            WHERE s.group_id = '{request.group_id}'
-            RETURN s.uuid as source, t.uuid as target, type(r) as edge_type,
-                   r.fact as fact, r.valid_at as valid_at, r.invalid_at as invalid_at
-        """
 
-        # Execute queries through graphiti driver
-        # Note: Actual implementation depends on graphiti_core driver API
+async def _stream_graph(records: list[dict[str, Any]]) -> AsyncIterator[bytes]:
+    """
+    Yield a GetGraphResponse JSON document chunk by chunk.
+    Nodes and edges are serialized a few hundred records at a time, so the
+    response models and the full body are never held in memory at once.
+    """
+    yield b'{"nodes":['
+    for start in range(0, len(records), _GRAPH_CHUNK_RECORDS):
+        chunk = records[start : start + _GRAPH_CHUNK_RECORDS]
+        # One orjson call per chunk; [1:-1] strips the list brackets
+        body = dumps([_graph_node(record) for record in chunk])[1:-1]
+        yield b',' + body if start else body
+
+    yield b'],"edges":['
+    first = True
+    for start in range(0, len(records), _GRAPH_CHUNK_RECORDS):
+        edges = [
+            GraphEdge.model_construct(source=record['uuid'], **edge)
+            for record in records[start : start + _GRAPH_CHUNK_RECORDS]
+            for edge in record['edges'] or []
+        ]
+        if edges:
+            body = dumps(edges)[1:-1]
+            yield body if first else b',' + body
+            first = False
+    yield b']}'
+
+
+@app.post('/graph', response_model=GetGraphResponse)
+async def get_graph(request: GetGraphRequest, graphiti: GraphitiDep):
+    """Get graph data for visualization."""
+    try:
+        # Each group lives in its own FalkorDB graph
+        driver = _group_driver(graphiti, request.group_id)
+        result = await driver.execute_query(GRAPH_QUERY, group_id=request.group_id)
+        records = result[0] if result else []
 
-        return GetGraphResponse(nodes=nodes, edges=edges)
+        # Still one JSON document (the Kanbu client reads it with response.json())
+        return StreamingResponse(_stream_graph(records), media_type='application/json')
 
     except Exception as e:
         logger.error(f'Failed to get graph: {e}')
@@ -819,9 +1251,14 @@ async def get_graph(request: GetGraphRequest):
 if __name__ == '__main__':
     import uvicorn
 
+    # Each worker is a separate process with its own Graphiti client, FalkorDB
+    # pool, caches and episode limit, so WEB_CONCURRENCY multiplies them (one
+    # worker by default); use `uvicorn --reload` for development instead
     uvicorn.run(
         'src.api.main:app',
-        host='0.0.0.0',
-        port=8000,
-        reload=True,
+        host=settings.host,
+        port=settings.port,
+        workers=settings.workers,
+        loop='uvloop',
+        http='httptools',
     )
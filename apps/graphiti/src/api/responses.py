@@ -0,0 +1,45 @@
+"""
+Kanbu Graphiti API Responses
+Response classes used by the FastAPI app.
+
+Endpoints build their response models with `model_construct` (the data is
+produced by us, not the client) and return these responses directly, so
+FastAPI skips re-validating and re-encoding them against `response_model`.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    # Response models are plain field containers; orjson encodes their
+    # values (datetimes, enums, nested models) itself
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize a response payload (dicts, lists or response models) to JSON."""
+    return orjson.dumps(
+        content,
+        default=_default,
+        # OPT_UTC_Z: UTC datetimes end in 'Z', as pydantic renders them
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z,
+    )
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class RenderedJsonResponse(Response):
+    """JSON response for a body that is already serialized (e.g. a cache hit)."""
+
+    media_type = 'application/json'
@@ -56,6 +56,34 @@ class AddEpisodeResponse(BaseModel):
     entity_details: list[ExtractedEntityInfo] = Field(default_factory=list)
 
 
+class BatchAddEpisodeRequest(BaseModel):
+    """Request to add multiple episodes at once (wiki bulk import)."""
+
+    items: list[AddEpisodeRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description='Episodes to add (max 100), processed sequentially in order',
+    )
+
+
+class BatchEpisodeResult(BaseModel):
+    """Outcome of a single episode in a batch."""
+
+    index: int = Field(..., description='Position of the episode in the request items')
+    success: bool
+    result: AddEpisodeResponse | None = None
+    error: str | None = None
+
+
+class BatchAddEpisodeResponse(BaseModel):
+    """Response after adding a batch of episodes."""
+
+    results: list[BatchEpisodeResult]
+    succeeded: int
+    failed: int
+
+
 class EntityTypeInfo(BaseModel):
     """Information about an available entity type."""
 
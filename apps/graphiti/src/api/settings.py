@@ -0,0 +1,85 @@
+"""
+Kanbu Graphiti API Settings
+Service configuration, read from the environment once at import.
+"""
+
+import os
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, ConfigDict
+
+from ..embedder import DEFAULT_CACHE_SIZE
+from .cache import DEFAULT_LOCAL_TTL_SECONDS, DEFAULT_TTL_SECONDS
+
+
+class Settings(BaseModel):
+    """Immutable service settings loaded from environment variables."""
+
+    model_config = ConfigDict(frozen=True)
+
+    # FalkorDB
+    falkordb_uri: str = 'redis://localhost:6379'
+    falkordb_host: str = 'localhost'
+    falkordb_port: int = 6379
+    falkordb_max_connections: int = 32
+    # Connections opened at startup so the first requests skip the handshake
+    falkordb_pool_warm: int = 8
+
+    # LLM / embeddings
+    openai_api_key: str | None = None
+    embedding_model: str = 'text-embedding-3-small'
+    embedding_dim: int = 1024
+    # Single-text (query) embeddings kept in memory per worker (0 disables)
+    embedding_cache_size: int = DEFAULT_CACHE_SIZE
+
+    # Episodes processed at once per worker, across all its requests; each
+    # one issues several LLM extraction calls
+    max_concurrent_episodes: int = 4
+
+    # Search cache TTL in seconds (0 disables the cache)
+    search_cache_ttl: int = DEFAULT_TTL_SECONDS
+    # In-process copy of recent cache entries, per worker (0 disables)
+    search_cache_local_ttl: int = DEFAULT_LOCAL_TTL_SECONDS
+
+    # Browser origins allowed by CORS; '*' (any) when CORS_ORIGIN is unset
+    cors_origins: tuple[str, ...] = ('*',)
+
+    # Server (used when running the module directly). Pools, caches and
+    # concurrency limits are per worker, so one worker keeps them service-wide
+    host: str = '0.0.0.0'
+    port: int = 8000
+    workers: int = 1
+
+    @classmethod
+    def from_env(cls) -> 'Settings':
+        """Build settings from the current environment."""
+        falkordb_uri = os.getenv('FALKORDB_URI', 'redis://localhost:6379')
+
+        # Parse FalkorDB URI (redis://host:port)
+        parsed = urlparse(falkordb_uri)
+
+        # Comma-separated, same format as the Kanbu API's CORS_ORIGIN
+        cors_origins = tuple(
+            origin.strip() for origin in os.getenv('CORS_ORIGIN', '').split(',') if origin.strip()
+        )
+
+        return cls(
+            falkordb_uri=falkordb_uri,
+            falkordb_host=parsed.hostname or 'localhost',
+            falkordb_port=parsed.port or 6379,
+            falkordb_max_connections=int(os.getenv('FALKORDB_MAX_CONNECTIONS', '32')),
+            falkordb_pool_warm=int(os.getenv('FALKORDB_POOL_WARM', '8')),
+            openai_api_key=os.getenv('OPENAI_API_KEY') or None,
+            embedding_model=os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small'),
+            embedding_dim=int(os.getenv('EMBEDDING_DIM', '1024')),
+            embedding_cache_size=int(os.getenv('EMBEDDING_CACHE_SIZE', str(DEFAULT_CACHE_SIZE))),
+            max_concurrent_episodes=int(os.getenv('GRAPHITI_MAX_CONCURRENT_EPISODES', '4')),
+            search_cache_ttl=int(os.getenv('SEARCH_CACHE_TTL', str(DEFAULT_TTL_SECONDS))),
+            search_cache_local_ttl=int(
+                os.getenv('SEARCH_CACHE_LOCAL_TTL', str(DEFAULT_LOCAL_TTL_SECONDS))
+            ),
+            cors_origins=cors_origins or ('*',),
+            host=os.getenv('HOST', '0.0.0.0'),
+            port=int(os.getenv('PORT', '8000')),
+            workers=int(os.getenv('WEB_CONCURRENCY', '1')),
+        )
@@ -0,0 +1,22 @@
+"""
+Kanbu Embedder Clients for Graphiti Knowledge Graph
+
+Embedder wrappers around graphiti_core's clients, tuned for
+episode ingestion from Kanbu wiki pages.
+"""
+
+from .batched_embedder import (
+    DEFAULT_CACHE_SIZE,
+    DEFAULT_MAX_BATCH,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_MAX_TOKENS,
+    BatchedOpenAIEmbedder,
+)
+
+__all__ = [
+    'BatchedOpenAIEmbedder',
+    'DEFAULT_CACHE_SIZE',
+    'DEFAULT_MAX_BATCH',
+    'DEFAULT_MAX_CONCURRENCY',
+    'DEFAULT_MAX_TOKENS',
+]
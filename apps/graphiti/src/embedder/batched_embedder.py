@@ -0,0 +1,188 @@
+"""
+Batched OpenAI Embedder
+
+Graphiti embeds every extracted entity name and edge fact of an episode.
+This embedder sends those texts to OpenAI in as few requests as possible,
+split into chunks that stay within the provider's per-request limits.
+Inputs are sorted by length and greedily packed into chunks capped by both
+item count and token count, so every chunk holds texts of similar size and
+uses as much of a request as is safe. Chunks are independent requests, so
+they are sent concurrently with a bounded number of requests in flight.
+
+Token counts use tiktoken when it is installed (`kanbu-graphiti[tiktoken]`)
+and a characters-per-token estimate otherwise.
+
+For text-embedding-3 models the configured dimension is requested from the
+API, so only the floats we store are transferred and decoded.
+
+Single-text embeddings (search queries, one-off node and edge updates) are
+kept in an LRU cache, so a repeated search query costs no OpenAI call.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+
+from graphiti_core.embedder import OpenAIEmbedder
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of inputs sent in a single embeddings request
+DEFAULT_MAX_BATCH = 64
+
+# Token budget for a single embeddings request
+DEFAULT_MAX_TOKENS = 8000
+
+# Maximum number of embeddings requests in flight (keeps us clear of 429s)
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Single-text embeddings kept in memory (~4 KB each at 1024 dimensions)
+DEFAULT_CACHE_SIZE = 8192
+
+# Rough characters-per-token ratio for English text, used without tiktoken
+_CHARS_PER_TOKEN = 4
+
+# Models that accept the `dimensions` parameter (server-side shortening)
+_DIMENSIONS_MODEL_PREFIX = 'text-embedding-3'
+
+
+class BatchedOpenAIEmbedder(OpenAIEmbedder):
+    """
+    OpenAI embedder that embeds lists of texts in chunked batch requests.
+
+    One `embeddings.create` call is issued per `max_batch` inputs instead of
+    one call per text, so an episode with dozens of entities costs a handful
+    of round-trips. Chunks are requested concurrently; the semaphore is
+    shared by all callers so parallel episodes cannot exceed the limit.
+    """
+
+    def __init__(
+        self,
+        *args,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.max_batch = max_batch
+        self.max_tokens = max_tokens
+        self.cache_size = cache_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._encoding = self._get_encoding()
+
+        # text -> embedding, least recently used first. Stored as float32,
+        # which is the precision the API returns, to keep entries small
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+
+        # Shortened vectors are L2-normalized truncations of the full vector,
+        # so cosine similarity against previously stored embeddings is unchanged
+        self._request_kwargs: dict[str, Any] = {}
+        if str(self.config.embedding_model).startswith(_DIMENSIONS_MODEL_PREFIX):
+            self._request_kwargs['dimensions'] = self.config.embedding_dim
+
+    async def create(
+        self, input_data: str | list[str] | Iterable[int] | Iterable[Iterable[int]]
+    ) -> list[float]:
+        text = self._cache_key(input_data)
+        if text is not None:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached.tolist()
+
+        result = await self.client.embeddings.create(
+            input=input_data, model=self.config.embedding_model, **self._request_kwargs
+        )
+        embedding = result.data[0].embedding[: self.config.embedding_dim]
+
+        if text is not None and self.cache_size > 0:
+            self._cache[text] = np.asarray(embedding, dtype=np.float32)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return embedding
+
+    async def create_batch(self, input_data_list: list[str]) -> list[list[float]]:
+        if not input_data_list:
+            return []
+
+        token_counts = [self._count_tokens(text) for text in input_data_list]
+        if len(input_data_list) <= self.max_batch and sum(token_counts) <= self.max_tokens:
+            return await self._create_chunk(input_data_list)
+
+        # Sort longest-first so each chunk holds texts of similar length,
+        # which evens out per-request latency across the gathered chunks
+        order = sorted(range(len(input_data_list)), key=lambda i: token_counts[i], reverse=True)
+
+        # Greedily pack into chunks within both the item and the token budget;
+        # a single text over the token budget is sent on its own
+        chunks: list[list[str]] = []
+        chunk: list[str] = []
+        chunk_tokens = 0
+        for i in order:
+            if chunk and (
+                len(chunk) >= self.max_batch or chunk_tokens + token_counts[i] > self.max_tokens
+            ):
+                chunks.append(chunk)
+                chunk, chunk_tokens = [], 0
+            chunk.append(input_data_list[i])
+            chunk_tokens += token_counts[i]
+        chunks.append(chunk)
+
+        results = await asyncio.gather(*[self._create_chunk(chunk) for chunk in chunks])
+
+        # Undo the length sort so embeddings line up with the inputs
+        embeddings: list[list[float]] = [[] for _ in input_data_list]
+        sorted_embeddings = (
+            embedding for chunk_embeddings in results for embedding in chunk_embeddings
+        )
+        for i, embedding in zip(order, sorted_embeddings, strict=True):
+            embeddings[i] = embedding
+        return embeddings
+
+    @staticmethod
+    def _cache_key(input_data: Any) -> str | None:
+        # Only a single text is cached; graphiti passes it as a one-item list
+        if isinstance(input_data, str):
+            return input_data
+        if isinstance(input_data, list) and len(input_data) == 1 and isinstance(input_data[0], str):
+            return input_data[0]
+        return None
+
+    def _get_encoding(self) -> Any:
+        if tiktoken is None:
+            return None
+
+        try:
+            encoding_name = tiktoken.encoding_name_for_model(str(self.config.embedding_model))
+        except KeyError:
+            encoding_name = 'cl100k_base'
+
+        # tiktoken downloads encodings on first use, which fails without network access
+        try:
+            return tiktoken.get_encoding(encoding_name)
+        except Exception as e:
+            logger.warning(f'tiktoken encoding {encoding_name} unavailable, estimating tokens: {e}')
+            return None
+
+    def _count_tokens(self, text: str) -> int:
+        if self._encoding is None:
+            return len(text) // _CHARS_PER_TOKEN + 1
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+    async def _create_chunk(self, chunk: list[str]) -> list[list[float]]:
+        async with self._semaphore:
+            result = await self.client.embeddings.create(
+                input=chunk, model=self.config.embedding_model, **self._request_kwargs
+            )
+        return [embedding.embedding[: self.config.embedding_dim] for embedding in result.data]
@@ -0,0 +1,39 @@
+"""
+Shared fixtures for the Kanbu Graphiti service tests.
+"""
+
+import pytest
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis commands SearchCache uses."""
+
+    def __init__(self):
+        self.data: dict[str, bytes | int] = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError('redis unavailable')
+
+    async def get(self, key: str):
+        self._check()
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes):
+        self._check()
+        self.data[key] = value
+
+    async def mget(self, keys: list[str]):
+        self._check()
+        return [self.data.get(key) for key in keys]
+
+    async def incr(self, key: str) -> int:
+        self._check()
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    return FakeRedis()
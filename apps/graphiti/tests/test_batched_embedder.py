@@ -0,0 +1,133 @@
+"""
+Tests for the chunking, ordering and caching of BatchedOpenAIEmbedder.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from graphiti_core.embedder.openai import OpenAIEmbedderConfig
+from src.embedder import BatchedOpenAIEmbedder
+
+
+def _vector(text: str) -> list[float]:
+    return [float(len(text)), float(sum(map(ord, text))), 0.0, 1.0, 9.0]
+
+
+class FakeEmbeddings:
+    """Records embeddings.create calls and returns a vector derived from each text."""
+
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    async def create(self, input, model, **kwargs):
+        self.calls.append({'input': input, 'model': model, **kwargs})
+        texts = [input] if isinstance(input, str) else input
+        return SimpleNamespace(data=[SimpleNamespace(embedding=_vector(t)) for t in texts])
+
+
+def _embedder(model: str = 'text-embedding-3-small', **kwargs) -> BatchedOpenAIEmbedder:
+    embeddings = FakeEmbeddings()
+    embedder = BatchedOpenAIEmbedder(
+        config=OpenAIEmbedderConfig(api_key='test', embedding_model=model, embedding_dim=4),
+        client=SimpleNamespace(embeddings=embeddings),
+        **kwargs,
+    )
+    # Use the characters-per-token estimate (len // 4 + 1) whether or not tiktoken is installed
+    embedder._encoding = None
+    return embedder
+
+
+@pytest.fixture
+def embedder() -> BatchedOpenAIEmbedder:
+    return _embedder(max_batch=3, max_tokens=20)
+
+
+async def test_small_batch_is_one_request(embedder):
+    texts = ['a', 'bb', 'ccc']
+
+    embeddings = await embedder.create_batch(texts)
+
+    assert [call['input'] for call in embedder.client.embeddings.calls] == [texts]
+    assert embeddings == [_vector(t)[:4] for t in texts]
+
+
+async def test_chunks_are_returned_in_input_order(embedder):
+    texts = ['x' * n for n in (1, 30, 5, 12, 2, 44, 7, 3)]
+
+    embeddings = await embedder.create_batch(texts)
+
+    assert embeddings == [_vector(t)[:4] for t in texts]
+    assert len(embedder.client.embeddings.calls) > 1
+
+
+async def test_chunks_respect_item_and_token_caps(embedder):
+    texts = ['x' * n for n in (1, 30, 5, 12, 2, 44, 7, 3, 50, 9)]
+
+    await embedder.create_batch(texts)
+
+    chunks = [call['input'] for call in embedder.client.embeddings.calls]
+    assert sorted(t for chunk in chunks for t in chunk) == sorted(texts)
+    for chunk in chunks:
+        assert len(chunk) <= embedder.max_batch
+        if len(chunk) > 1:
+            assert sum(embedder._count_tokens(t) for t in chunk) <= embedder.max_tokens
+
+
+async def test_oversize_text_is_sent_alone(embedder):
+    oversize = 'y' * 200
+    texts = ['a', oversize, 'b']
+
+    embeddings = await embedder.create_batch(texts)
+
+    assert [oversize] in [call['input'] for call in embedder.client.embeddings.calls]
+    assert embeddings == [_vector(t)[:4] for t in texts]
+
+
+async def test_empty_batch_makes_no_request(embedder):
+    assert await embedder.create_batch([]) == []
+    assert embedder.client.embeddings.calls == []
+
+
+async def test_dimensions_requested_only_for_text_embedding_3():
+    shortened = _embedder()
+    await shortened.create_batch(['a'])
+    assert shortened.client.embeddings.calls[0]['dimensions'] == 4
+
+    legacy = _embedder(model='text-embedding-ada-002')
+    await legacy.create_batch(['a'])
+    assert 'dimensions' not in legacy.client.embeddings.calls[0]
+
+
+async def test_create_reuses_cached_single_text():
+    embedder = _embedder()
+
+    first = await embedder.create(['query'])
+    second = await embedder.create('query')
+
+    assert first == second == _vector('query')[:4]
+    assert len(embedder.client.embeddings.calls) == 1
+
+
+async def test_create_cache_evicts_least_recently_used():
+    embedder = _embedder(cache_size=2)
+
+    await embedder.create('a')
+    await embedder.create('b')
+    await embedder.create('a')
+    await embedder.create('c')  # evicts 'b', the least recently used
+    calls = len(embedder.client.embeddings.calls)
+
+    await embedder.create('a')
+    assert len(embedder.client.embeddings.calls) == calls
+    await embedder.create('b')
+    assert len(embedder.client.embeddings.calls) == calls + 1
+
+
+async def test_zero_cache_size_disables_cache():
+    embedder = _embedder(cache_size=0)
+
+    await embedder.create('a')
+    await embedder.create('a')
+
+    assert len(embedder.client.embeddings.calls) == 2
@@ -0,0 +1,130 @@
+"""
+Tests for the search endpoints' cache and in-flight coalescing.
+"""
+
+import asyncio
+
+import pytest
+
+from src.api import main
+from src.api.cache import SearchCache
+from src.api.responses import OrjsonResponse
+from src.api.schemas import SearchRequest
+
+
+class Backend:
+    """Search handler that counts calls and can be held open or made to fail."""
+
+    def __init__(self):
+        self.calls = 0
+        self.fail_first = False
+        self.release = asyncio.Event()
+        self.release.set()
+        self.started = asyncio.Event()
+        self.version = 'v1'
+
+    async def __call__(self, request: SearchRequest):
+        self.calls += 1
+        version = self.version
+        self.started.set()
+        await self.release.wait()
+        if self.fail_first and self.calls == 1:
+            raise RuntimeError('search failed')
+        return OrjsonResponse({'query': request.query, 'version': version})
+
+
+@pytest.fixture
+def backend() -> Backend:
+    return Backend()
+
+
+@pytest.fixture
+def search(backend):
+    return main._coalesced_search('test')(backend)
+
+
+@pytest.fixture
+def search_cache(monkeypatch, redis) -> SearchCache:
+    cache = SearchCache(redis)
+    monkeypatch.setattr(main, 'search_cache', cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(main, 'search_cache', None)
+
+
+REQUEST = SearchRequest(query='q', group_id='g')
+
+
+async def test_identical_concurrent_searches_run_once(search, backend):
+    backend.release.clear()
+    tasks = [asyncio.create_task(search(request=REQUEST)) for _ in range(5)]
+    await backend.started.wait()
+    backend.release.set()
+
+    responses = await asyncio.gather(*tasks)
+
+    assert backend.calls == 1
+    assert {bytes(r.body) for r in responses} == {b'{"query":"q","version":"v1"}'}
+    assert main._inflight_searches == {}
+
+
+async def test_leader_failure_lets_waiters_search_themselves(search, backend):
+    backend.fail_first = True
+    backend.release.clear()
+    leader = asyncio.create_task(search(request=REQUEST))
+    await backend.started.wait()
+    waiters = [asyncio.create_task(search(request=REQUEST)) for _ in range(2)]
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    with pytest.raises(RuntimeError):
+        await leader
+    responses = await asyncio.gather(*waiters)
+
+    # Waiters do not reuse a failed result; each runs its own search
+    assert backend.calls == 3
+    assert all(b'"v1"' in r.body for r in responses)
+
+
+async def test_cancelled_waiter_does_not_cancel_leader(search, backend):
+    backend.release.clear()
+    leader = asyncio.create_task(search(request=REQUEST))
+    await backend.started.wait()
+    waiter = asyncio.create_task(search(request=REQUEST))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    assert (await leader).status_code == 200
+    assert waiter.cancelled()
+    assert main._inflight_searches == {}
+
+
+async def test_cached_search_skips_backend(search, backend, search_cache):
+    await search(request=REQUEST)
+    response = await search(request=REQUEST)
+
+    assert backend.calls == 1
+    assert response.body == b'{"query":"q","version":"v1"}'
+
+
+async def test_search_overlapping_write_is_not_served_afterwards(search, backend, search_cache):
+    backend.release.clear()
+    before = asyncio.create_task(search(request=REQUEST))
+    await backend.started.wait()
+
+    # An episode is saved while the search runs
+    backend.version = 'v2'
+    await search_cache.invalidate('g')
+    backend.release.set()
+    assert b'"v1"' in (await before).body
+
+    after = await search(request=REQUEST)
+
+    assert backend.calls == 2
+    assert b'"v2"' in after.body
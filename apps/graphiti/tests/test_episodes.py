@@ -0,0 +1,92 @@
+"""
+Tests for how concurrent episode writes are scheduled across groups.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.api import main
+from src.api.schemas import AddEpisodeRequest
+
+
+class FakeDriver:
+    def __init__(self, database: str):
+        self._database = database
+
+    def clone(self, database: str) -> 'FakeDriver':
+        return FakeDriver(database)
+
+
+class FakeGraphiti:
+    """Records which graph each episode was written to and how many overlapped."""
+
+    running: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    written: list[tuple[str, str]] = []
+
+    def __init__(self, graph_driver: FakeDriver, **clients):
+        self.driver = graph_driver
+        self.clients = clients
+
+    async def add_episode(self, name: str, group_id: str, **kwargs):
+        running = self.running[group_id] = self.running.get(group_id, 0) + 1
+        self.peak[group_id] = max(self.peak.get(group_id, 0), running)
+        await asyncio.sleep(0.01)
+        self.written.append((self.driver._database, group_id))
+        self.running[group_id] -= 1
+        return SimpleNamespace(episode=SimpleNamespace(uuid=name), nodes=[], edges=[])
+
+
+@pytest.fixture(autouse=True)
+def fake_graphiti(monkeypatch):
+    FakeGraphiti.running, FakeGraphiti.peak, FakeGraphiti.written = {}, {}, []
+    monkeypatch.setattr(main, 'Graphiti', FakeGraphiti)
+    monkeypatch.setattr(main, 'search_cache', None)
+    main._group_clients.clear()
+    yield
+    main._group_clients.clear()
+
+
+@pytest.fixture
+def graphiti():
+    return SimpleNamespace(
+        driver=FakeDriver('kanbu_wiki'),
+        llm_client=object(),
+        embedder=object(),
+        cross_encoder=object(),
+        max_coroutines=None,
+    )
+
+
+async def test_episodes_run_in_order_per_group_and_in_their_own_graph(graphiti):
+    requests = [
+        AddEpisodeRequest(name=f'{group}-{i}', episode_body='body', group_id=group)
+        for i in range(3)
+        for group in ('wiki-ws-1', 'wiki-ws-2', 'wiki-ws-3')
+    ]
+
+    await asyncio.gather(*[main._process_episode(graphiti, r) for r in requests])
+
+    assert FakeGraphiti.peak == {'wiki-ws-1': 1, 'wiki-ws-2': 1, 'wiki-ws-3': 1}
+    assert all(database == group for database, group in FakeGraphiti.written)
+    assert len(FakeGraphiti.written) == len(requests)
+    # The shared client is never switched to a group
+    assert graphiti.driver._database == 'kanbu_wiki'
+    assert main._group_locks == {}
+
+
+async def test_group_clients_share_llm_and_embedder(graphiti):
+    client = main._group_graphiti(graphiti, 'wiki-ws-1')
+
+    assert client is main._group_graphiti(graphiti, 'wiki-ws-1')
+    assert client.clients['llm_client'] is graphiti.llm_client
+    assert client.clients['embedder'] is graphiti.embedder
+
+
+async def test_invalid_group_id_creates_no_client(graphiti):
+    with pytest.raises(Exception, match='group_id'):
+        main._group_graphiti(graphiti, 'ws 1; DROP')
+
+    assert main._group_clients == {}
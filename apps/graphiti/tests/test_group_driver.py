@@ -0,0 +1,57 @@
+"""
+Tests for the per-group drivers used by read endpoints.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from graphiti_core.driver.falkordb_driver import FalkorDriver
+from src.api import main
+
+
+@pytest.fixture
+def index_builds(monkeypatch) -> list[str]:
+    builds: list[str] = []
+
+    async def build_indices_and_constraints(self, delete_existing=False):
+        builds.append(self._database)
+
+    monkeypatch.setattr(
+        FalkorDriver, 'build_indices_and_constraints', build_indices_and_constraints
+    )
+    return builds
+
+
+@pytest.fixture
+async def graphiti(index_builds):
+    driver = FalkorDriver(falkor_db=object(), database='kanbu_wiki')
+    await asyncio.sleep(0)
+    index_builds.clear()
+    main._group_clients.clear()
+    yield SimpleNamespace(driver=driver)
+    main._group_clients.clear()
+
+
+async def test_read_driver_targets_group_without_building_indices(graphiti, index_builds):
+    driver = main._group_driver(graphiti, 'wiki-ws-1')
+    await asyncio.sleep(0)
+
+    assert driver._database == 'wiki-ws-1'
+    assert driver.client is graphiti.driver.client
+    assert graphiti.driver._database == 'kanbu_wiki'
+    assert index_builds == []
+
+
+async def test_read_driver_reuses_main_and_write_drivers(graphiti):
+    assert main._group_driver(graphiti, 'kanbu_wiki') is graphiti.driver
+
+    writer = SimpleNamespace(driver=graphiti.driver.clone(database='wiki-ws-1'))
+    main._group_clients['wiki-ws-1'] = writer
+    assert main._group_driver(graphiti, 'wiki-ws-1') is writer.driver
+
+
+async def test_read_driver_rejects_invalid_group_id(graphiti):
+    with pytest.raises(Exception, match='group_id'):
+        main._group_driver(graphiti, 'ws-1"}) DETACH DELETE n //')
@@ -0,0 +1,104 @@
+"""
+Tests for the vectorized maximal marginal relevance reranker.
+"""
+
+import numpy as np
+import pytest
+
+from graphiti_core.helpers import normalize_l2
+from graphiti_core.search.search_utils import maximal_marginal_relevance
+
+
+def _reference_mmr(
+    query_vector: list[float],
+    candidates: dict[str, list[float]],
+    mmr_lambda: float = 0.5,
+    min_score: float = -2.0,
+) -> tuple[list[str], list[float]]:
+    """The pairwise loop maximal_marginal_relevance replaced."""
+    query_array = np.array(query_vector)
+    candidate_arrays = {uuid: normalize_l2(embedding) for uuid, embedding in candidates.items()}
+    uuids = list(candidate_arrays.keys())
+
+    similarity_matrix = np.zeros((len(uuids), len(uuids)))
+    for i, uuid_1 in enumerate(uuids):
+        for j, uuid_2 in enumerate(uuids[:i]):
+            similarity = np.dot(candidate_arrays[uuid_1], candidate_arrays[uuid_2])
+            similarity_matrix[i, j] = similarity
+            similarity_matrix[j, i] = similarity
+
+    mmr_scores = {}
+    for i, uuid in enumerate(uuids):
+        max_sim = np.max(similarity_matrix[i, :])
+        mmr_scores[uuid] = (
+            mmr_lambda * np.dot(query_array, candidate_arrays[uuid]) + (mmr_lambda - 1) * max_sim
+        )
+
+    uuids.sort(reverse=True, key=lambda c: mmr_scores[c])
+    kept = [uuid for uuid in uuids if mmr_scores[uuid] >= min_score]
+    return kept, [float(mmr_scores[uuid]) for uuid in kept]
+
+
+def _assert_same(actual, expected):
+    assert actual[0] == expected[0]
+    assert actual[1] == pytest.approx(expected[1], abs=1e-12)
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('mmr_lambda', [0.0, 0.5, 1.0])
+def test_matches_reference_on_random_vectors(seed, mmr_lambda):
+    rng = np.random.default_rng(seed)
+    query = normalize_l2(rng.normal(size=16).tolist()).tolist()
+    candidates = {f'c{i}': rng.normal(size=16).tolist() for i in range(40)}
+
+    _assert_same(
+        maximal_marginal_relevance(query, candidates, mmr_lambda),
+        _reference_mmr(query, candidates, mmr_lambda),
+    )
+
+
+def test_zero_vectors_are_kept_unnormalized():
+    query = [1.0, 0.0, 0.0]
+    candidates = {'zero': [0.0, 0.0, 0.0], 'a': [3.0, 4.0, 0.0], 'also_zero': [0.0, 0.0, 0.0]}
+
+    result = maximal_marginal_relevance(query, candidates)
+
+    _assert_same(result, _reference_mmr(query, candidates))
+    assert all(np.isfinite(result[1]))
+
+
+@pytest.mark.parametrize(
+    'candidates',
+    [
+        # Mirrored around the query: same query similarity, same max similarity
+        {'b': [0.0, 1.0], 'a': [0.0, -1.0]},
+        # Duplicates
+        {'d': [1.0, 1.0], 'c': [1.0, 1.0], 'e': [2.0, 2.0]},
+    ],
+)
+def test_ties_keep_input_order(candidates):
+    query = [1.0, 0.0]
+
+    result = maximal_marginal_relevance(query, candidates)
+
+    _assert_same(result, _reference_mmr(query, candidates))
+    assert result[0] == list(candidates)
+
+
+def test_min_score_filters_like_reference():
+    rng = np.random.default_rng(7)
+    query = rng.normal(size=8).tolist()
+    candidates = {f'c{i}': rng.normal(size=8).tolist() for i in range(20)}
+
+    _assert_same(
+        maximal_marginal_relevance(query, candidates, min_score=0.0),
+        _reference_mmr(query, candidates, min_score=0.0),
+    )
+
+
+def test_empty_and_single_candidate():
+    assert maximal_marginal_relevance([1.0, 0.0], {}) == ([], [])
+    _assert_same(
+        maximal_marginal_relevance([1.0, 0.0], {'only': [2.0, 0.0]}),
+        _reference_mmr([1.0, 0.0], {'only': [2.0, 0.0]}),
+    )
@@ -0,0 +1,111 @@
+"""
+Tests for the write-generation scheme of the search cache.
+"""
+
+import pytest
+
+from src.api import cache as cache_module
+from src.api.cache import SearchCache
+from src.api.schemas import SearchRequest
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, 'monotonic', clock)
+    return clock
+
+
+async def _key(cache: SearchCache, request: SearchRequest) -> str:
+    return SearchCache.make_key('search', request, await cache.generation(request.group_id))
+
+
+async def test_hit_after_set(redis):
+    cache = SearchCache(redis)
+    request = SearchRequest(query='q', group_id='g')
+
+    key = await _key(cache, request)
+    await cache.set(key, b'body')
+
+    assert await cache.get(await _key(cache, request)) == b'body'
+
+
+async def test_store_started_before_write_is_not_served(redis):
+    cache = SearchCache(redis)
+    request = SearchRequest(query='q', group_id='g')
+
+    # The search reads its key, an episode is written meanwhile, then it stores
+    key = await _key(cache, request)
+    await cache.invalidate('g')
+    await cache.set(key, b'stale')
+
+    assert await cache.get(await _key(cache, request)) is None
+
+
+async def test_other_worker_sees_write_after_local_generation_expires(redis, clock):
+    writer = SearchCache(redis, local_ttl=30)
+    reader = SearchCache(redis, local_ttl=30)
+    request = SearchRequest(query='q', group_id='g')
+
+    key = await _key(reader, request)
+    await reader.set(key, b'old')
+    await writer.invalidate('g')
+
+    # The writer sees its own write at once, the reader within local_ttl
+    assert await writer.generation('g') != await reader.generation('g')
+    assert await _key(reader, request) == key
+
+    clock.now += 31
+    assert await reader.generation('g') == await writer.generation('g')
+    assert await reader.get(await _key(reader, request)) is None
+
+
+async def test_group_write_retires_cross_group_searches_only(redis):
+    cache = SearchCache(redis)
+    before = {group: await cache.generation(group) for group in ('g', 'h', None)}
+
+    await cache.invalidate('g')
+
+    assert await cache.generation('g') != before['g']
+    assert await cache.generation(None) != before[None]
+    assert await cache.generation('h') == before['h']
+
+
+async def test_global_write_retires_every_group(redis):
+    cache = SearchCache(redis)
+    before = {group: await cache.generation(group) for group in ('g', 'h', None)}
+
+    await cache.invalidate()
+
+    for group, generation in before.items():
+        assert await cache.generation(group) != generation
+
+
+async def test_local_generation_is_not_rolled_back(redis):
+    cache = SearchCache(redis)
+    await cache.invalidate('g')
+    current = await cache.generation('g')
+
+    # A read that raced the INCR returns the older value
+    cache._set_local_generation('search:gen:g', 0)
+
+    assert await cache.generation('g') == current
+
+
+async def test_unreadable_generation_disables_caching(redis):
+    cache = SearchCache(redis, local_ttl=0)
+    redis.fail = True
+
+    assert await cache.generation('g') is None
+    # Errors are logged, never raised
+    await cache.invalidate('g')
+    await cache.set('key', b'body')
+    assert await cache.get('missing') is None